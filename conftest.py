@@ -0,0 +1,4 @@
+"""
+Pytest configuration: the repo root holds this conftest, so pytest puts it on
+sys.path and the tests can import the top-level modules.
+"""
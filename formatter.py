@@ -1,7 +1,16 @@
 """
 Text formatter module for rendering text as ASCII art letters.
 """
+from enum import Enum
+
 from letter_glyph import UNFRAMED_ROWS, LetterGlyph, create_inverted_letter
+from tiles import TileChar, scale_tile
+
+
+class Align(Enum):
+    START = "start"
+    CENTER = "center"
+    END = "end"
 
 
 def combine_letters(letters: list[LetterGlyph], isInverted: bool) -> list[str]:
@@ -76,26 +85,147 @@ def process_text(input_string: str, is_inverted: bool = False) -> str:
     return "\n".join(combined_lines)
 
 
-def frame_word(word: list[list[str]], width: int, height: int, fill_char: str = "X") -> list[str]:
+def new_canvas(width: int, height: int, fill_char: str = "X") -> list[list[str]]:
     """
-    Frame a word (list of letter rows) to a specific width and height.
+    Allocate a width x height grid buffer for frame_word_into.
+
+    Batch jobs with a constant canvas size can allocate this once and pass it
+    to every frame_word_into call.
+    """
+    return [[fill_char] * width for _ in range(height)]
+
+
+def _align_offset(align: Align, space: int) -> int:
+    """Offset of content within a span; negative when the content overflows."""
+    match align:
+        case Align.START:
+            return 0
+        case Align.CENTER:
+            return space // 2
+        case Align.END:
+            return space
+
+
+def _even_offsets(x0: int, y0: int, halign: Align) -> tuple[int, int]:
+    """
+    Nudge the offsets by one cell so that x0 + y0 is even.
+
+    The SVG renderer alternates tile fills by absolute (row + column) parity, so
+    an odd offset would flip every tile and undo --init_tile_flipped.
+    """
+    if (x0 + y0) % 2 == 0:
+        return x0, y0
+    if x0 > 0:
+        return x0 - 1, y0
+    if y0 > 0:
+        return x0, y0 - 1
+    # Overflowing on both axes: crop one more cell off an aligned axis
+    return (x0 - 1, y0) if halign != Align.START else (x0, y0 - 1)
+
+
+def _scale_rows(rows: list[str], scale: int) -> list[str]:
+    """Upscale rows of tiles, expanding each tile into a scale x scale block."""
+    blocks: dict[str, list[str]] = {}
+    scaled: list[str] = []
+    for line in rows:
+        for c in line:
+            if c not in blocks:
+                tileChar: TileChar = c  # type: ignore
+                blocks[c] = scale_tile(tileChar, scale)
+        line_blocks = [blocks[c] for c in line]
+        scaled.extend("".join(b[i] for b in line_blocks) for i in range(scale))
+    return scaled
+
+
+def frame_word_into(
+    word: list[list[str]],
+    out: list[list[str]],
+    fill_char: str = "X",
+    halign: Align = Align.START,
+    valign: Align = Align.START,
+    fit: bool = False,
+    truncate: bool = True,
+) -> list[list[str]]:
+    """
+    Lay a word (list of letter rows) out on a preallocated canvas, in place.
+
+    The canvas is cleared to fill_char first, so the same buffer can be reused
+    for every word of a batch. Only the grid is reused: the word's own rows are
+    still built per call.
 
     Args:
         word: A list of rows representing the word (each row is a list of strings).
-        width: The desired width of the framed word.
-        height: The desired height of the framed word.
+        out: Grid buffer (e.g. from new_canvas); all rows must have the same width.
         fill_char: The character to use for padding.
+        halign: Horizontal placement of the word within the canvas.
+        valign: Vertical placement of the word within the canvas.
+        fit: Upscale the word by the largest whole factor that fits (see scale_tile).
+        truncate: Crop a word that overflows the canvas; if False, raise ValueError.
 
     Returns:
-        A list of strings representing the framed word.
+        The `out` buffer.
+
+    Centre and end alignment may shift the word by one cell so that its offset
+    keeps the tile parity the SVG renderer expects.
     """
+    height = len(out)
+    width = len(out[0]) if out else 0
+    if any(len(row) != width for row in out):
+        raise ValueError("Canvas buffer rows must all have the same width")
+    for row in out:
+        row[:] = fill_char * width
+
     # Combine the rows of all letters into a single word
     combined_rows = ["".join(row) for row in zip(*word)]
+    word_width = max((len(row) for row in combined_rows), default=0)
+    word_height = len(combined_rows)
+    if not word_width:
+        return out
+
+    scale = max(1, min(width // word_width, height // word_height)) if fit else 1
+    if scale > 1:
+        combined_rows = _scale_rows(combined_rows, scale)
+    scaled_width = word_width * scale
+    scaled_height = word_height * scale
+    if not truncate and (scaled_width > width or scaled_height > height):
+        raise ValueError(f"Word of size {scaled_width}x{scaled_height} does not fit in {width}x{height}")
+
+    x0, y0 = _even_offsets(
+        _align_offset(halign, width - scaled_width),
+        _align_offset(valign, height - scaled_height),
+        halign,
+    )
+    start = max(0, -x0)
+    for r in range(max(0, -y0), min(scaled_height, height - y0)):
+        line = combined_rows[r]
+        end = min(len(line), width - x0)
+        if start < end:
+            out[y0 + r][x0 + start:x0 + end] = line[start:end]
+    return out
+
+
+def frame_word(
+    word: list[list[str]],
+    width: int,
+    height: int,
+    fill_char: str = "X",
+    halign: Align = Align.START,
+    valign: Align = Align.START,
+    fit: bool = False,
+    truncate: bool = True,
+) -> list[str]:
+    """
+    Frame a word (list of letter rows) to a specific width and height.
 
-    # Pad each row to the specified width
-    framed_rows = [row[:width].ljust(width, fill_char) for row in combined_rows]
+    Args:
+        word: A list of rows representing the word (each row is a list of strings).
+        width: The desired width of the framed word.
+        height: The desired height of the framed word.
+        fill_char: The character to use for padding.
+        halign, valign, fit, truncate: See frame_word_into.
 
-    # Adjust the number of rows to the specified height
-    while len(framed_rows) < height:
-        framed_rows.append(fill_char * width)
-    return framed_rows[:height]
+    Returns:
+        A list of strings representing the framed word.
+    """
+    canvas = frame_word_into(word, new_canvas(width, height, fill_char), fill_char, halign, valign, fit, truncate)
+    return ["".join(row) for row in canvas]
@@ -4,11 +4,22 @@ Takes an input string and outputs a special graphical version of it.
 """
 import argparse
 
-from formatter import process_text
+from formatter import Align, frame_word, process_text
 from svg.svg_render import display_svg, lines_to_svg
 from tilestyle import TileStyle
 
 
+def _parse_canvas(value: str) -> tuple[int, int]:
+    """Parse a canvas size given as WxH (e.g. 40x12)."""
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid canvas size {value!r}, expected WxH") from None
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"canvas size must be positive, got {value!r}")
+    return width, height
+
+
 def main():
     """Main entry point for the application."""
     parser = argparse.ArgumentParser(description="Render text as Truchet-style graphics.")
@@ -17,7 +28,14 @@ def main():
     parser.add_argument("--inverted", "-i", action="store_true", help="Use inverted (empty-space) style")
     parser.add_argument("--init_tile_flipped", "-f", action="store_true", help="First tile is hourglass (⧗), as opposed to the bowtie (⧓, default)")
     parser.add_argument("--svg", "-s", action="store_true", help="Render as SVG and open in browser")
+    parser.add_argument("--canvas", "-c", metavar="WxH", type=_parse_canvas, help="Lay the output out on a fixed W x H cell canvas")
+    parser.add_argument("--halign", choices=[a.value for a in Align], help="Horizontal alignment on the canvas (default: center)")
+    parser.add_argument("--valign", choices=[a.value for a in Align], help="Vertical alignment on the canvas (default: center)")
+    parser.add_argument("--fit", action="store_true", help="Scale the text up to fill the canvas, expanding each tile into a larger block")
+    parser.add_argument("--no-truncate", action="store_true", help="Fail instead of cropping text that overflows the canvas")
     args = parser.parse_args()
+    if args.canvas is None and (args.halign or args.valign or args.fit or args.no_truncate):
+        parser.error("--halign, --valign, --fit and --no-truncate require --canvas")
 
     if args.word is not None:
         user_input = args.word
@@ -27,6 +45,22 @@ def main():
         user_input = input("Enter text to render: ")
 
     output = process_text(user_input, is_inverted=args.inverted)
+    if args.canvas:
+        width, height = args.canvas
+        try:
+            framed = frame_word(
+                [output.split("\n")] if output else [],
+                width,
+                height,
+                fill_char="X" if args.inverted else " ",
+                halign=Align(args.halign or "center"),
+                valign=Align(args.valign or "center"),
+                fit=args.fit,
+                truncate=not args.no_truncate,
+            )
+        except ValueError as e:
+            parser.error(str(e))
+        output = "\n".join(framed)
 
     if args.word is None:
         print("\nOutput:")
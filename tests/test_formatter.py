@@ -0,0 +1,82 @@
+import pytest
+
+from formatter import Align, frame_word, frame_word_into, new_canvas
+from tiles import scale_tile
+
+
+def test_frame_word_pads_to_canvas():
+    assert frame_word([["ab", "cd"]], 4, 3) == ["abXX", "cdXX", "XXXX"]
+
+
+def test_frame_word_center_keeps_even_offset():
+    # Centring would put the word at (1, 1); keep x0 + y0 even
+    assert frame_word([["ab"]], 4, 3, fill_char=".", halign=Align.CENTER, valign=Align.CENTER) == [
+        "....",
+        ".ab.",
+        "....",
+    ]
+    # Centring would put the word at (1, 0); nudge it back to column 0
+    assert frame_word([["ab"]], 4, 1, fill_char=".", halign=Align.CENTER) == ["ab.."]
+    # Centring would put the word at (0, 1); with no horizontal slack the row moves up
+    assert frame_word([["ab", "cd"]], 3, 4, fill_char=".", halign=Align.CENTER, valign=Align.CENTER) == [
+        "ab.",
+        "cd.",
+        "...",
+        "...",
+    ]
+
+
+def test_frame_word_end_alignment():
+    assert frame_word([["ab"]], 4, 3, fill_char=".", halign=Align.END, valign=Align.END) == ["....", "....", "..ab"]
+    # (2, 1) has odd parity, so the word moves one column left
+    assert frame_word([["ab"]], 4, 2, fill_char=".", halign=Align.END, valign=Align.END) == ["....", ".ab."]
+
+
+def test_frame_word_truncates_overflow():
+    assert frame_word([["abcdef"]], 3, 1) == ["abc"]
+    assert frame_word([["abcdef"]], 4, 1, halign=Align.END) == ["cdef"]
+
+
+def test_frame_word_overflow_raises_without_truncate():
+    with pytest.raises(ValueError):
+        frame_word([["abcdef"]], 3, 1, truncate=False)
+
+
+def test_frame_word_empty_word_gives_blank_canvas():
+    assert frame_word([], 3, 2, fill_char=" ") == ["   ", "   "]
+
+
+def test_scale_tile_keeps_corner_on_block_diagonal():
+    assert scale_tile("ʎ", 3) == ["  ʎ", " ʎX", "ʎXX"]
+    assert scale_tile("λ", 3) == ["λ  ", "Xλ ", "XXλ"]
+    assert scale_tile("y", 2) == ["Xy", "y "]
+    assert scale_tile("ɣ", 2) == ["ɣX", " ɣ"]
+    assert scale_tile("X", 2) == ["XX", "XX"]
+
+
+def test_frame_word_fit_upscales_glyph():
+    assert frame_word([["ʎXλ"]], 6, 2, fill_char=" ", fit=True) == [
+        " ʎXXλ ",
+        "ʎXXXXλ",
+    ]
+
+
+def test_frame_word_fit_never_shrinks():
+    assert frame_word([["abcd"]], 2, 1, fit=True) == ["ab"]
+
+
+def test_frame_word_into_rejects_ragged_buffer():
+    with pytest.raises(ValueError):
+        frame_word_into([["ab"]], [["X", "X"], ["X"]])
+
+
+def test_frame_word_into_reuses_buffer_without_bleed_through():
+    canvas = new_canvas(4, 2, ".")
+    rows = canvas[0]
+    result = frame_word_into([["abcd", "efgh"]], canvas, fill_char=".")
+    assert result is canvas
+    assert ["".join(row) for row in canvas] == ["abcd", "efgh"]
+
+    frame_word_into([["z"]], canvas, fill_char=".")
+    assert canvas[0] is rows
+    assert ["".join(row) for row in canvas] == ["z...", "...."]
@@ -2,7 +2,7 @@
 Tile/character operations for Truchet-style glyphs.
 """
 from enum import Enum
-from typing import Literal
+from typing import Callable, Literal
 
 TileChar = Literal[" ", "X", "λ", "ɣ", "y", "ʎ"]
 
@@ -90,3 +90,33 @@ def inverse(ch: TileChar) -> TileChar:
             return "y"
         case _:
             return ch
+
+
+def scale_tile(ch: TileChar, scale: int) -> list[str]:
+    """
+    Expand a tile into a scale x scale block of tiles drawing the same shape.
+    Corner tiles keep their diagonal along the block's diagonal, with solid (X)
+    cells on the filled side and empty cells on the cut-off side.
+    """
+    def block(
+        diagonal: TileChar,
+        on_diagonal: Callable[[int, int], bool],
+        filled: Callable[[int, int], bool],
+    ) -> list[str]:
+        return [
+            "".join(diagonal if on_diagonal(i, j) else "X" if filled(i, j) else " " for j in range(scale))
+            for i in range(scale)
+        ]
+
+    last = scale - 1
+    match ch:
+        case "λ":
+            return block(ch, lambda i, j: i == j, lambda i, j: i > j)
+        case "ɣ":
+            return block(ch, lambda i, j: i == j, lambda i, j: i < j)
+        case "y":
+            return block(ch, lambda i, j: i + j == last, lambda i, j: i + j < last)
+        case "ʎ":
+            return block(ch, lambda i, j: i + j == last, lambda i, j: i + j > last)
+        case _:
+            return [ch * scale] * scale